@@ -2,56 +2,66 @@
 Caching layer for recommendation results.
 Uses in-memory cache for fast response times.
 """
-from typing import Optional, Dict, List
-from functools import lru_cache
+from typing import Any, Optional, List, Tuple, Callable
+from cachetools import TTLCache
 from app.models import Outfit, RecommendationRequest
-import hashlib
-import json
+import orjson
 
 
 class RecommendationCache:
     """
-    Simple in-memory cache for recommendations.
+    Simple in-memory LRU cache for recommendations with time-based expiry.
     In production, this could be Redis or similar.
     """
     
-    def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, List[Dict]] = {}
+    def __init__(self, max_size: int = 1000, ttl: float = 300):
+        self.cache: "TTLCache[Tuple, bytes]" = TTLCache(maxsize=max_size, ttl=ttl)
         self.max_size = max_size
+        self.ttl = ttl
+        
+        # Second level: scored candidates per base product (built by the
+        # caller), shared by requests that only differ in their filters
+        self.candidate_cache: "TTLCache[str, Any]" = TTLCache(maxsize=max_size, ttl=ttl)
     
-    def _cache_key(self, request: RecommendationRequest) -> str:
-        """Generate cache key from request."""
-        key_data = {
-            "base_product_id": request.base_product_id,
-            "occasion": request.occasion.value if request.occasion else None,
-            "season": request.season.value if request.season else None,
-            "max_budget": request.max_budget,
-            "style_preference": request.style_preference.value if request.style_preference else None,
-            "num_recommendations": request.num_recommendations
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+    def _cache_key(self, request: RecommendationRequest) -> Tuple:
+        """Generate cache key from request (enums, None and floats hash natively)."""
+        return (
+            request.base_product_id,
+            request.occasion,
+            request.season,
+            request.max_budget,
+            request.style_preference,
+            request.num_recommendations
+        )
     
-    def get(self, request: RecommendationRequest) -> Optional[List[Dict]]:
-        """Get cached recommendations."""
-        key = self._cache_key(request)
-        return self.cache.get(key)
+    def get(self, request: RecommendationRequest) -> Optional[bytes]:
+        """Get cached recommendations as an encoded JSON payload."""
+        # TTLCache drops expired entries and refreshes recency on access
+        return self.cache.get(self._cache_key(request))
     
-    def set(self, request: RecommendationRequest, outfits: List[Outfit]):
-        """Cache recommendations."""
+    def set(self, request: RecommendationRequest, outfits: List[Outfit]) -> bytes:
+        """Cache recommendations and return the encoded JSON payload."""
         key = self._cache_key(request)
         
-        # Simple LRU eviction if cache is full
-        if len(self.cache) >= self.max_size:
-            # Remove oldest entry (simple FIFO)
-            if self.cache:
-                first_key = next(iter(self.cache))
-                del self.cache[first_key]
-        
-        # Store as dictionaries for serialization
-        self.cache[key] = [outfit.to_dict() for outfit in outfits]
+        # Store the encoded response body so hits skip serialization entirely
+        payload = orjson.dumps([outfit.to_dict() for outfit in outfits])
+        self.cache[key] = payload
+        return payload
+    
+    def get_candidates(
+        self,
+        base_product_id: str,
+        build: Callable[[str], Any]
+    ) -> Any:
+        """Get the candidate set for a base product, building it on a miss."""
+        candidate_set = self.candidate_cache.get(base_product_id)
+        if candidate_set is None:
+            candidate_set = build(base_product_id)
+            self.candidate_cache[base_product_id] = candidate_set
+        return candidate_set
     
     def clear(self):
         """Clear all cached entries."""
         self.cache.clear()
+        self.candidate_cache.clear()
 
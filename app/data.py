@@ -18,7 +18,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 255, 255),
             price=29.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL),
             brand="Basics Co"
         ),
         Product(
@@ -29,7 +29,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 32, 96),
             price=199.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.DATE],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.DATE),
             brand="Formal Wear"
         ),
         Product(
@@ -40,7 +40,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(20, 20, 20),
             price=299.99,
             season=Season.FALL,
-            occasion=[Occasion.EVERYDAY, Occasion.PARTY, Occasion.DATE],
+            occasion=(Occasion.EVERYDAY, Occasion.PARTY, Occasion.DATE),
             brand="Urban Edge"
         ),
         Product(
@@ -51,7 +51,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 182, 193),
             price=49.99,
             season=Season.SPRING,
-            occasion=[Occasion.EVERYDAY, Occasion.DATE, Occasion.PARTY],
+            occasion=(Occasion.EVERYDAY, Occasion.DATE, Occasion.PARTY),
             brand="Boho Chic"
         ),
         Product(
@@ -62,7 +62,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(128, 128, 128),
             price=59.99,
             season=Season.FALL,
-            occasion=[Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL),
             brand="Comfort Wear"
         ),
         Product(
@@ -73,7 +73,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(250, 250, 250),
             price=79.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT),
             brand="Professional"
         ),
         Product(
@@ -84,7 +84,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(220, 20, 60),
             price=69.99,
             season=Season.WINTER,
-            occasion=[Occasion.EVERYDAY, Occasion.DATE],
+            occasion=(Occasion.EVERYDAY, Occasion.DATE),
             brand="Cozy Wear"
         ),
         Product(
@@ -95,7 +95,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(59, 89, 152),
             price=89.99,
             season=Season.SPRING,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Classic Denim"
         ),
         
@@ -108,7 +108,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(25, 25, 112),
             price=79.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.DATE, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.DATE, Occasion.TRAVEL),
             brand="Denim Co"
         ),
         Product(
@@ -119,7 +119,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 0, 0),
             price=129.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT),
             brand="Formal Wear"
         ),
         Product(
@@ -130,7 +130,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(240, 230, 140),
             price=69.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.WORK, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.WORK, Occasion.TRAVEL),
             brand="Casual Co"
         ),
         Product(
@@ -141,7 +141,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(105, 105, 105),
             price=49.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.SPORTS, Occasion.EVERYDAY],
+            occasion=(Occasion.SPORTS, Occasion.EVERYDAY),
             brand="Athletic"
         ),
         Product(
@@ -152,7 +152,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 255, 255),
             price=89.99,
             season=Season.SUMMER,
-            occasion=[Occasion.EVERYDAY, Occasion.DATE, Occasion.PARTY],
+            occasion=(Occasion.EVERYDAY, Occasion.DATE, Occasion.PARTY),
             brand="Summer Style"
         ),
         Product(
@@ -163,7 +163,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 0, 128),
             price=99.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT),
             brand="Professional"
         ),
         Product(
@@ -174,7 +174,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(20, 20, 20),
             price=199.99,
             season=Season.FALL,
-            occasion=[Occasion.PARTY, Occasion.DATE],
+            occasion=(Occasion.PARTY, Occasion.DATE),
             brand="Urban Edge"
         ),
         Product(
@@ -185,7 +185,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(245, 245, 220),
             price=79.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Adventure"
         ),
         
@@ -198,7 +198,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 255, 255),
             price=99.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.SPORTS, Occasion.TRAVEL),
             brand="Sport Co"
         ),
         Product(
@@ -209,7 +209,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 0, 0),
             price=199.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT),
             brand="Formal Wear"
         ),
         Product(
@@ -220,7 +220,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(139, 69, 19),
             price=249.99,
             season=Season.FALL,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Outdoor Co"
         ),
         Product(
@@ -231,7 +231,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(20, 20, 20),
             price=179.99,
             season=Season.FALL,
-            occasion=[Occasion.EVERYDAY, Occasion.PARTY, Occasion.DATE],
+            occasion=(Occasion.EVERYDAY, Occasion.PARTY, Occasion.DATE),
             brand="Urban Edge"
         ),
         Product(
@@ -242,7 +242,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(210, 180, 140),
             price=149.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.EVERYDAY],
+            occasion=(Occasion.WORK, Occasion.EVERYDAY),
             brand="Professional"
         ),
         Product(
@@ -253,7 +253,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(220, 20, 60),
             price=119.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.SPORTS, Occasion.EVERYDAY],
+            occasion=(Occasion.SPORTS, Occasion.EVERYDAY),
             brand="Athletic"
         ),
         Product(
@@ -264,7 +264,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 32, 96),
             price=89.99,
             season=Season.SUMMER,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Summer Style"
         ),
         Product(
@@ -275,7 +275,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(128, 128, 128),
             price=129.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.SPORTS, Occasion.EVERYDAY],
+            occasion=(Occasion.SPORTS, Occasion.EVERYDAY),
             brand="Athletic"
         ),
         
@@ -288,7 +288,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 0, 0),
             price=49.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.EVERYDAY],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.EVERYDAY),
             brand="Accessories Co"
         ),
         Product(
@@ -299,7 +299,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(192, 192, 192),
             price=299.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.DATE],
+            occasion=(Occasion.WORK, Occasion.FORMAL_EVENT, Occasion.DATE),
             brand="Timepieces"
         ),
         Product(
@@ -310,7 +310,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(139, 69, 19),
             price=79.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.WORK],
+            occasion=(Occasion.EVERYDAY, Occasion.WORK),
             brand="Leather Goods"
         ),
         Product(
@@ -321,7 +321,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(20, 20, 20),
             price=89.99,
             season=Season.SUMMER,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Sun Protection"
         ),
         Product(
@@ -332,7 +332,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 32, 96),
             price=39.99,
             season=Season.WINTER,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL),
             brand="Winter Co"
         ),
         Product(
@@ -343,7 +343,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 215, 0),
             price=149.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.PARTY, Occasion.DATE],
+            occasion=(Occasion.PARTY, Occasion.DATE),
             brand="Jewelry Co"
         ),
         Product(
@@ -354,7 +354,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(245, 245, 220),
             price=29.99,
             season=Season.SUMMER,
-            occasion=[Occasion.EVERYDAY, Occasion.TRAVEL, Occasion.SPORTS],
+            occasion=(Occasion.EVERYDAY, Occasion.TRAVEL, Occasion.SPORTS),
             brand="Outdoor Co"
         ),
         Product(
@@ -365,7 +365,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(220, 20, 60),
             price=24.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.SPORTS, Occasion.EVERYDAY],
+            occasion=(Occasion.SPORTS, Occasion.EVERYDAY),
             brand="Athletic"
         ),
         Product(
@@ -376,7 +376,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(0, 0, 0),
             price=79.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.EVERYDAY, Occasion.WORK, Occasion.TRAVEL],
+            occasion=(Occasion.EVERYDAY, Occasion.WORK, Occasion.TRAVEL),
             brand="Travel Co"
         ),
         Product(
@@ -387,7 +387,7 @@ def generate_mock_products() -> list[Product]:
             color=Color(255, 255, 255),
             price=199.99,
             season=Season.ALL_SEASON,
-            occasion=[Occasion.FORMAL_EVENT, Occasion.DATE],
+            occasion=(Occasion.FORMAL_EVENT, Occasion.DATE),
             brand="Jewelry Co"
         ),
     ]
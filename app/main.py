@@ -4,11 +4,13 @@ Optimized for <1s response time with caching and efficient algorithms.
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from typing import List, Optional
 from pydantic import BaseModel
+from collections import Counter
 import time
 
-from app.models import Product, RecommendationRequest, Occasion, Season, Style
+from app.models import RecommendationRequest, Occasion, Season, Style
 from app.recommender import OutfitRecommender
 from app.cache import RecommendationCache
 from app.data import generate_mock_products
@@ -32,9 +34,17 @@ app.add_middleware(
 
 # Initialize global components
 products = generate_mock_products()
+product_dicts = [product.to_dict() for product in products]
+products_by_id = {product.id: product for product in products}
+category_counts = Counter(product.category.value for product in products)
 recommender = OutfitRecommender(products)
 cache = RecommendationCache()
 
+# Request value -> enum member lookups, built once instead of per-request Enum(value) calls
+OCCASION_BY_VALUE = {occasion.value: occasion for occasion in Occasion}
+SEASON_BY_VALUE = {season.value: season for season in Season}
+STYLE_BY_VALUE = {style.value: style for style in Style}
+
 
 # Request/Response models
 class RecommendationRequestModel(BaseModel):
@@ -69,6 +79,19 @@ class OutfitResponse(BaseModel):
     total_price: float
 
 
+def _parse_enum(value: Optional[str], members: dict, field: str):
+    """Resolve an optional enum value, rejecting unknown values with a 400."""
+    if not value:
+        return None
+    member = members.get(value)
+    if member is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {field} '{value}'. Expected one of: {', '.join(members)}"
+        )
+    return member
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -93,16 +116,18 @@ async def health():
 @app.get("/products", response_model=List[ProductResponse])
 async def get_products():
     """Get all available products."""
-    return [ProductResponse(**product.to_dict()) for product in products]
+    # Product dicts are built once at startup; skip per-request model validation
+    return JSONResponse(content=product_dicts)
 
 
 @app.get("/products/{product_id}", response_model=ProductResponse)
 async def get_product(product_id: str):
     """Get a specific product by ID."""
-    product = next((p for p in products if p.id == product_id), None)
+    product = products_by_id.get(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return ProductResponse(**product.to_dict())
+    # Trusted dict; returning a Response skips response_model validation
+    return JSONResponse(content=product.to_dict())
 
 
 @app.post("/recommendations", response_model=List[OutfitResponse])
@@ -116,24 +141,29 @@ async def get_recommendations(request: RecommendationRequestModel):
     # Check cache first
     cache_request = RecommendationRequest(
         base_product_id=request.base_product_id,
-        occasion=Occasion(request.occasion) if request.occasion else None,
-        season=Season(request.season) if request.season else None,
+        occasion=_parse_enum(request.occasion, OCCASION_BY_VALUE, "occasion"),
+        season=_parse_enum(request.season, SEASON_BY_VALUE, "season"),
         max_budget=request.max_budget,
-        style_preference=Style(request.style_preference) if request.style_preference else None,
+        style_preference=_parse_enum(request.style_preference, STYLE_BY_VALUE, "style_preference"),
         num_recommendations=request.num_recommendations
     )
     
     cached_result = cache.get(cache_request)
     if cached_result:
-        # Return cached results directly (already in dict format)
-        return [OutfitResponse(**outfit_dict) for outfit_dict in cached_result]
+        # Return cached results directly (already encoded JSON),
+        # bypassing response_model revalidation and serialization
+        return Response(content=cached_result, media_type="application/json")
     
     # Generate recommendations
     try:
-        outfits = recommender.generate_recommendations(cache_request)
+        candidate_set = cache.get_candidates(
+            cache_request.base_product_id,
+            recommender.build_candidates
+        )
+        outfits = recommender.generate_recommendations(cache_request, candidate_set)
         
-        # Cache the results
-        cache.set(cache_request, outfits)
+        # Cache the results; the encoded payload doubles as the response body
+        payload = cache.set(cache_request, outfits)
         
         elapsed = time.time() - start_time
         
@@ -141,7 +171,7 @@ async def get_recommendations(request: RecommendationRequestModel):
         if elapsed > 1.0:
             print(f"WARNING: Response time {elapsed:.3f}s exceeds 1s target")
         
-        return [OutfitResponse(**outfit.to_dict()) for outfit in outfits]
+        return Response(content=payload, media_type="application/json")
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -155,7 +185,7 @@ async def get_stats():
     return {
         "total_products": len(products),
         "products_by_category": {
-            category.value: len([p for p in products if p.category == category])
+            category: category_counts.get(category, 0)
             for category in ["top", "bottom", "footwear", "accessory"]
         },
         "cache_size": len(cache.cache),
@@ -2,9 +2,11 @@
 Data models for the Outfit Recommendation System.
 """
 from enum import Enum
-from typing import List, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+import sys
+import numpy as np
 
 
 class Category(str, Enum):
@@ -47,40 +49,74 @@ class Occasion(str, Enum):
     TRAVEL = "travel"
 
 
-@dataclass
+# Integer codes for enum members, used by the recommender's columnar product store
+CATEGORY_IDS = {category: i for i, category in enumerate(Category)}
+STYLE_IDS = {style: i for i, style in enumerate(Style)}
+SEASON_IDS = {season: i for i, season in enumerate(Season)}
+ALL_SEASON_ID = SEASON_IDS[Season.ALL_SEASON]
+OCCASION_IDS = {occasion: i for i, occasion in enumerate(Occasion)}
+
+# Single-bit masks for testing membership against Product.occasion_bits
+OCCASION_BITS = {occasion: 1 << i for occasion, i in OCCASION_IDS.items()}
+
+
+@lru_cache(maxsize=1024)
+def _rgb_to_hsv_scalar(r: int, g: int, b: int) -> tuple:
+    """Convert one RGB color to HSV, memoized since the catalog repeats colors."""
+    r, g, b = r / 255.0, g / 255.0, b / 255.0
+    max_val = max(r, g, b)
+    min_val = min(r, g, b)
+    delta = max_val - min_val
+    
+    # Hue calculation
+    if delta == 0:
+        h = 0
+    elif max_val == r:
+        h = 60 * (((g - b) / delta) % 6)
+    elif max_val == g:
+        h = 60 * (((b - r) / delta) + 2)
+    else:
+        h = 60 * (((r - g) / delta) + 4)
+    
+    # Saturation
+    s = 0 if max_val == 0 else delta / max_val
+    
+    # Value
+    v = max_val
+    
+    return (h, s, v)
+
+
+@dataclass(frozen=True, slots=True)
 class Color:
     """RGB color representation for harmony calculations."""
     r: int
     g: int
     b: int
     
+    @property
+    def packed(self) -> int:
+        """Color packed into a single 0x00RRGGBB integer."""
+        return (self.r << 16) | (self.g << 8) | self.b
+    
     def to_hsv(self) -> tuple:
         """Convert RGB to HSV for color harmony calculations."""
-        r, g, b = self.r / 255.0, self.g / 255.0, self.b / 255.0
-        max_val = max(r, g, b)
-        min_val = min(r, g, b)
-        delta = max_val - min_val
-        
-        # Hue calculation
-        if delta == 0:
-            h = 0
-        elif max_val == r:
-            h = 60 * (((g - b) / delta) % 6)
-        elif max_val == g:
-            h = 60 * (((b - r) / delta) + 2)
-        else:
-            h = 60 * (((r - g) / delta) + 4)
-        
-        # Saturation
-        s = 0 if max_val == 0 else delta / max_val
-        
-        # Value
-        v = max_val
-        
-        return (h, s, v)
+        return _rgb_to_hsv_scalar(self.r, self.g, self.b)
+
 
+# One serialized color dict per distinct color, shared by every product dict
+_color_dict_cache: Dict[Color, dict] = {}
 
-@dataclass
+
+def _color_dict(color: Color) -> dict:
+    """Get the shared serialized form of a color (do not mutate)."""
+    color_dict = _color_dict_cache.get(color)
+    if color_dict is None:
+        color_dict = _color_dict_cache[color] = {"r": color.r, "g": color.g, "b": color.b}
+    return color_dict
+
+
+@dataclass(frozen=True, slots=True)
 class Product:
     """Product data model."""
     id: str
@@ -90,27 +126,61 @@ class Product:
     color: Color
     price: float
     season: Season
-    occasion: List[Occasion]
+    occasion: Tuple[Occasion, ...]
     brand: Optional[str] = None
     description: Optional[str] = None
+    category_id: int = field(init=False, repr=False, compare=False)
+    style_id: int = field(init=False, repr=False, compare=False)
+    season_id: int = field(init=False, repr=False, compare=False)
+    occasion_bits: int = field(init=False, repr=False, compare=False)
+    hue: float = field(init=False, repr=False, compare=False)
+    sat: float = field(init=False, repr=False, compare=False)
+    val: float = field(init=False, repr=False, compare=False)
+    _dict: dict = field(init=False, repr=False, compare=False)
     
-    def to_dict(self) -> dict:
-        """Convert product to dictionary."""
-        return {
+    def __post_init__(self):
+        # Intern repeated strings so duplicates share one object
+        if self.brand:
+            object.__setattr__(self, "brand", sys.intern(self.brand))
+        
+        # Integer ids so hot comparisons avoid Enum.__eq__
+        object.__setattr__(self, "category_id", CATEGORY_IDS[self.category])
+        object.__setattr__(self, "style_id", STYLE_IDS[self.style])
+        object.__setattr__(self, "season_id", SEASON_IDS[self.season])
+        
+        # Occasion set packed into a bitmask for branch-free membership tests
+        occasion_bits = 0
+        for occ in self.occasion:
+            occasion_bits |= OCCASION_BITS[occ]
+        object.__setattr__(self, "occasion_bits", occasion_bits)
+        
+        # HSV is read on every scoring pass, so store it as plain floats
+        hue, sat, val = self.color.to_hsv()
+        object.__setattr__(self, "hue", hue)
+        object.__setattr__(self, "sat", sat)
+        object.__setattr__(self, "val", val)
+        
+        # Products are immutable, so the serialized form (with enum values
+        # already materialized) is built once and shared by every to_dict() call
+        object.__setattr__(self, "_dict", {
             "id": self.id,
             "name": self.name,
             "category": self.category.value,
             "style": self.style.value,
-            "color": {"r": self.color.r, "g": self.color.g, "b": self.color.b},
+            "color": _color_dict(self.color),
             "price": self.price,
             "season": self.season.value,
             "occasion": [occ.value for occ in self.occasion],
             "brand": self.brand,
             "description": self.description
-        }
+        })
+    
+    def to_dict(self) -> dict:
+        """Convert product to dictionary (shared; do not mutate)."""
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Outfit:
     """Complete outfit combination."""
     top: Product
@@ -134,7 +204,7 @@ class Outfit:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecommendationRequest:
     """Request model for outfit recommendations."""
     base_product_id: str
@@ -144,3 +214,34 @@ class RecommendationRequest:
     style_preference: Optional[Style] = None
     num_recommendations: int = 5
 
+
+@dataclass(slots=True)
+class ProductColumns:
+    """
+    Structure-of-arrays view of a product list, one entry per product index.
+    Lets filtering and batch scoring run as vectorized NumPy operations.
+    """
+    prices: np.ndarray
+    category_ids: np.ndarray
+    style_ids: np.ndarray
+    season_ids: np.ndarray
+    colors: np.ndarray  # packed 0x00RRGGBB
+    occasion_masks: np.ndarray  # Product.occasion_bits
+    hues: np.ndarray
+    sats: np.ndarray
+    
+    @classmethod
+    def from_products(cls, products: List[Product]) -> "ProductColumns":
+        """Build the columns for a product list."""
+        n = len(products)
+        return cls(
+            prices=np.array([p.price for p in products], dtype=np.float64),
+            category_ids=np.fromiter((p.category_id for p in products), dtype=np.int8, count=n),
+            style_ids=np.fromiter((p.style_id for p in products), dtype=np.int8, count=n),
+            season_ids=np.fromiter((p.season_id for p in products), dtype=np.int8, count=n),
+            colors=np.fromiter((p.color.packed for p in products), dtype=np.uint32, count=n),
+            occasion_masks=np.fromiter((p.occasion_bits for p in products), dtype=np.uint32, count=n),
+            # HSV as already computed on each Product, so both views agree
+            hues=np.fromiter((p.hue for p in products), dtype=np.float64, count=n),
+            sats=np.fromiter((p.sat for p in products), dtype=np.float64, count=n)
+        )
@@ -2,14 +2,53 @@
 Recommendation engine for generating outfit combinations.
 Uses intelligent matching and caching for performance.
 """
-import random
-from typing import List, Optional, Dict
-from collections import defaultdict
+import itertools
+from typing import List, Optional, Dict, Tuple
+from dataclasses import dataclass
+import numpy as np
 from app.models import (
     Product, Outfit, Category, Style, Season, Occasion,
-    RecommendationRequest
+    RecommendationRequest, ProductColumns,
+    CATEGORY_IDS, STYLE_IDS, SEASON_IDS, ALL_SEASON_ID, OCCASION_BITS
 )
-from app.scorer import OutfitScorer
+from app.scorer import get_scorer
+
+# Largest number of outfits returned for a single request
+MAX_RECOMMENDATIONS = 20
+
+# Top-ranked candidates kept per outfit slot; bounds enumeration at
+# CANDIDATES_PER_SLOT ** 3 combinations regardless of the request
+CANDIDATES_PER_SLOT = 10
+
+# Columns of an outfit row: top, bottom, footwear and up to 3 accessories
+OUTFIT_SLOTS = 6
+
+# Compatibility score per bucket: analogous, complementary, triadic, other
+COMPAT_SCORES = np.array([0.9, 0.85, 0.75, 0.6], dtype=np.float32)
+
+
+@dataclass(slots=True)
+class CandidateSet:
+    """
+    Ranked candidates for a base product, independent of request filters.
+    Cached per base product and reused across filter permutations.
+    """
+    base_product: Product
+    base_idx: int
+    ranked: Dict[Category, np.ndarray]  # product indices per category, best first, base excluded
+
+
+@dataclass(slots=True)
+class CategoryColumns:
+    """
+    Filter columns for the products of one category (structure-of-arrays),
+    sorted by price so a budget cap selects a prefix.
+    """
+    indices: np.ndarray  # product indices into the catalog
+    prices: np.ndarray
+    style_ids: np.ndarray
+    season_ids: np.ndarray
+    occasion_masks: np.ndarray  # Product.occasion_bits
 
 
 class OutfitRecommender:
@@ -25,57 +64,129 @@ class OutfitRecommender:
     
     def _index_products(self):
         """Index products by category for fast lookup."""
-        self.by_category: Dict[Category, List[Product]] = defaultdict(list)
         self.by_id: Dict[str, Product] = {}
+        self.idx_by_id: Dict[str, int] = {}
         
-        for product in self.products:
-            self.by_category[product.category].append(product)
+        for i, product in enumerate(self.products):
             self.by_id[product.id] = product
+            self.idx_by_id[product.id] = i
+        
+        # Structure-of-arrays view of the catalog, one entry per product index,
+        # so filtering and scoring run as vectorized masks instead of per-product loops
+        self.catalog = ProductColumns.from_products(self.products)
+        
+        # Per-category slices of the filter columns, cheapest first
+        self.columns: Dict[Category, CategoryColumns] = {}
+        for category in Category:
+            indices = np.nonzero(self.catalog.category_ids == CATEGORY_IDS[category])[0]
+            indices = indices[np.argsort(self.catalog.prices[indices], kind="stable")]
+            self.columns[category] = CategoryColumns(
+                indices=indices,
+                prices=self.catalog.prices[indices],
+                style_ids=self.catalog.style_ids[indices],
+                season_ids=self.catalog.season_ids[indices],
+                occasion_masks=self.catalog.occasion_masks[indices]
+            )
     
     def _precompute_compatibility(self):
         """
         Precompute compatibility scores between products.
-        This is done once at initialization for performance.
+        This is done once at initialization for performance, as dense
+        sub-matrices for the category pairs that can share an outfit:
+        every cross-category pair, plus accessory-accessory (a base accessory
+        is combined with other accessories). Rows and columns follow the
+        order of self.columns.
         """
-        self.compatibility_cache: Dict[tuple, float] = {}
+        # Position of each product within its category's columns
+        self.column_pos = np.empty(len(self.products), dtype=np.intp)
+        for cols in self.columns.values():
+            self.column_pos[cols.indices] = np.arange(len(cols.indices))
+        
+        pairs = list(itertools.combinations(Category, 2))
+        pairs.append((Category.ACCESSORY, Category.ACCESSORY))
         
-        # Precompute color compatibility for all pairs
-        for i, p1 in enumerate(self.products):
-            for p2 in self.products[i+1:]:
-                key = tuple(sorted([p1.id, p2.id]))
-                score = self._calculate_color_compatibility(p1.color, p2.color)
-                self.compatibility_cache[key] = score
+        self.compat_blocks: Dict[Tuple[Category, Category], np.ndarray] = {}
+        for cat_a, cat_b in pairs:
+            hues_a = self.catalog.hues[self.columns[cat_a].indices]
+            hues_b = self.catalog.hues[self.columns[cat_b].indices]
+            
+            # Pairwise hue difference, normalized to 0-180 degrees
+            hue_diff = np.abs(hues_a[:, None] - hues_b[None, :])
+            hue_diff = np.minimum(hue_diff, 360 - hue_diff)
+            
+            # Quick compatibility bucket, one byte per pair; scores via COMPAT_SCORES
+            self.compat_blocks[(cat_a, cat_b)] = np.select(
+                [
+                    hue_diff < 30,  # Analogous
+                    (hue_diff > 150) & (hue_diff < 180),  # Complementary
+                    (hue_diff > 115) & (hue_diff < 125),  # Triadic
+                ],
+                [0, 1, 2],
+                default=3  # Less compatible
+            ).astype(np.uint8)
     
-    def _calculate_color_compatibility(self, color1, color2) -> float:
-        """Quick color compatibility check."""
-        hsv1 = color1.to_hsv()
-        hsv2 = color2.to_hsv()
+    def _compat_row(self, base_idx: int, category: Category) -> np.ndarray:
+        """Compatibility buckets of a base product against one category's columns."""
+        base_category = self.products[base_idx].category
+        pos = self.column_pos[base_idx]
+        block = self.compat_blocks.get((base_category, category))
+        if block is not None:
+            return block[pos]
+        return self.compat_blocks[(category, base_category)][:, pos]
+    
+    def build_candidates(self, base_product_id: str) -> CandidateSet:
+        """
+        Score and rank candidates for a base product.
+        Only depends on the base product, so the result can be cached and
+        shared by requests that differ only in their filters.
+        """
+        base_product = self.by_id.get(base_product_id)
+        if not base_product:
+            raise ValueError(f"Product {base_product_id} not found")
+        base_idx = self.idx_by_id[base_product_id]
+        base_style_id = base_product.style_id
         
-        hue_diff = abs(hsv1[0] - hsv2[0])
-        if hue_diff > 180:
-            hue_diff = 360 - hue_diff
+        # Presort each category once; requests only filter these orders.
+        # The base fills its own slot, so only accessories are ranked
+        # within the base's category.
+        ranked = {}
+        for category, cols in self.columns.items():
+            if category == base_product.category and category != Category.ACCESSORY:
+                ranked[category] = cols.indices[:0]
+                continue
+            
+            # Row of the compatibility sub-matrix, plus a bonus for style match
+            compatibility = COMPAT_SCORES[self._compat_row(base_idx, category)].astype(np.float64)
+            scores = compatibility + np.where(cols.style_ids == base_style_id, 0.2, 0.0)
+            
+            # Best first, ties in catalog order; the base itself is excluded
+            keep = cols.indices != base_idx
+            indices = cols.indices[keep]
+            ranked[category] = indices[np.lexsort((indices, -scores[keep]))]
         
-        # Quick compatibility score
-        if hue_diff < 30:
-            return 0.9  # Analogous
-        elif 150 < hue_diff < 180:
-            return 0.85  # Complementary
-        elif 115 < hue_diff < 125:
-            return 0.75  # Triadic
-        else:
-            return 0.6  # Less compatible
+        return CandidateSet(
+            base_product=base_product,
+            base_idx=base_idx,
+            ranked=ranked
+        )
     
     def generate_recommendations(
         self, 
-        request: RecommendationRequest
+        request: RecommendationRequest,
+        candidate_set: Optional[CandidateSet] = None
     ) -> List[Outfit]:
         """
         Generate outfit recommendations from a base product.
         Optimized for <1s response time.
         """
-        base_product = self.by_id.get(request.base_product_id)
-        if not base_product:
-            raise ValueError(f"Product {request.base_product_id} not found")
+        if candidate_set is None:
+            candidate_set = self.build_candidates(request.base_product_id)
+        base_product = candidate_set.base_product
+        
+        # Cap the outfit count, which also bounds the work per request
+        num_recommendations = min(request.num_recommendations, MAX_RECOMMENDATIONS)
+        if num_recommendations <= 0:
+            return []
         
         # Filter products by constraints
         candidates = self._filter_candidates(
@@ -86,46 +197,44 @@ class OutfitRecommender:
             request.style_preference
         )
         
-        # Generate outfit combinations
-        outfits = []
-        max_attempts = 100  # Limit to prevent infinite loops
-        attempts = 0
-        
-        while len(outfits) < request.num_recommendations and attempts < max_attempts:
-            attempts += 1
-            
-            try:
-                outfit = self._generate_single_outfit(
-                    base_product,
-                    candidates,
-                    request
-                )
-                
-                # Check for duplicates
-                if not self._is_duplicate(outfit, outfits):
-                    outfits.append(outfit)
-            except Exception:
-                # Skip invalid combinations
-                continue
+        # Rank each slot's candidates against the base product and keep a
+        # fixed number of the best; the base product fills its own slot
+        slots = []
+        for category in [Category.TOP, Category.BOTTOM, Category.FOOTWEAR]:
+            if category == base_product.category:
+                slots.append([candidate_set.base_idx])
+            else:
+                ranked = self._rank_candidates(candidates[category], candidate_set, category)
+                slots.append(ranked[:CANDIDATES_PER_SLOT].tolist())
         
-        # Score and rank all outfits
-        scorer = OutfitScorer(
-            target_occasion=request.occasion,
-            target_season=request.season,
-            max_budget=request.max_budget
-        )
+        # Enumerate combinations of the top-ranked picks, crossed with every
+        # accessory option, as rows of product indices: top, bottom, footwear,
+        # then up to 3 accessories (-1 = empty). Combinations are unique, so
+        # no duplicate outfits can be produced.
+        combos = np.array(list(itertools.product(*slots)), dtype=np.int32).reshape(-1, 3)
+        accessory_options = self._accessory_options(candidates[Category.ACCESSORY], candidate_set)
+        num_options = len(accessory_options)
+        outfit_idxs = np.empty((len(combos) * num_options, OUTFIT_SLOTS), dtype=np.int32)
+        outfit_idxs[:, :3] = np.repeat(combos, num_options, axis=0)
+        outfit_idxs[:, 3:] = np.tile(accessory_options, (len(combos), 1))
         
-        scored_outfits = []
-        for outfit in outfits:
-            score, reasoning = scorer.score_outfit(outfit)
-            outfit.match_score = score
-            outfit.reasoning = reasoning
-            scored_outfits.append(outfit)
+        # Score every row in one vectorized pass, keep each combination's best
+        # accessory option (fewest accessories on ties), then the best combinations
+        scorer = get_scorer(request.occasion, request.season, request.max_budget)
+        batch_scores = scorer.score_batch(self.catalog, outfit_idxs).reshape(len(combos), num_options)
+        best_option = batch_scores.argmax(axis=1)
+        combo_scores = batch_scores[np.arange(len(combos)), best_option]
+        best = np.argsort(-combo_scores, kind="stable")[:num_recommendations]
+        best_rows = outfit_idxs.reshape(len(combos), num_options, OUTFIT_SLOTS)[best, best_option[best]]
         
-        # Sort by score (descending)
-        scored_outfits.sort(key=lambda x: x.match_score, reverse=True)
+        # Materialize and explain only the outfits being returned
+        outfits = []
+        for row in best_rows:
+            outfit = self._build_outfit(row)
+            outfit.match_score, outfit.reasoning = scorer.score_outfit(outfit)
+            outfits.append(outfit)
         
-        return scored_outfits[:request.num_recommendations]
+        return outfits
     
     def _filter_candidates(
         self,
@@ -134,80 +243,79 @@ class OutfitRecommender:
         season: Optional[Season],
         max_budget: Optional[float],
         style_preference: Optional[Style]
-    ) -> Dict[Category, List[Product]]:
-        """Filter products by constraints for fast candidate selection."""
-        filtered = defaultdict(list)
+    ) -> Dict[Category, np.ndarray]:
+        """
+        Filter products by constraints for fast candidate selection.
+        Returns the matching product indices per category.
+        """
+        # Resolve every predicate constant once, outside the category loop
+        occasion_bit = OCCASION_BITS[occasion] if occasion else 0
+        season_id = SEASON_IDS[season] if season else -1
+        style_id = STYLE_IDS[style_preference] if style_preference else -1
+        base_style_id = base_product.style_id
+        # Rough budget estimate - assume base product is already included,
+        # and allow items that could fit with some flexibility
+        budget_cap = (max_budget - base_product.price) * 1.5 if max_budget else None
         
+        filtered = {}
         for category in [Category.TOP, Category.BOTTOM, Category.FOOTWEAR, Category.ACCESSORY]:
-            candidates = self.by_category[category].copy()
-            
-            # Filter by occasion
-            if occasion:
-                candidates = [p for p in candidates if occasion in p.occasion]
+            cols = self.columns[category]
             
-            # Filter by season
-            if season:
-                candidates = [
-                    p for p in candidates 
-                    if p.season == season or p.season == Season.ALL_SEASON
-                ]
+            # Columns are sorted by price, so the affordable items are a prefix
+            end = len(cols.indices)
+            if budget_cap is not None:
+                end = np.searchsorted(cols.prices, budget_cap, side="right")
             
-            # Filter by style preference (if specified)
-            if style_preference:
+            # All remaining predicates fused into one mask over that prefix
+            mask = np.ones(end, dtype=bool)
+            if occasion_bit:
+                mask &= (cols.occasion_masks[:end] & occasion_bit) != 0
+            if season_id >= 0:
+                season_ids = cols.season_ids[:end]
+                mask &= (season_ids == season_id) | (season_ids == ALL_SEASON_ID)
+            if style_id >= 0:
                 # Allow base style or preferred style
-                candidates = [
-                    p for p in candidates 
-                    if p.style == style_preference or p.style == base_product.style
-                ]
+                style_ids = cols.style_ids[:end]
+                mask &= (style_ids == style_id) | (style_ids == base_style_id)
             
-            # Filter by budget (rough estimate - assume base product is already included)
-            if max_budget:
-                base_price = base_product.price
-                remaining_budget = max_budget - base_price
-                # Rough filtering - allow items that could fit
-                candidates = [
-                    p for p in candidates 
-                    if p.price <= remaining_budget * 1.5  # Allow some flexibility
-                ]
-            
-            filtered[category] = candidates
+            filtered[category] = cols.indices[:end][mask]
         
         return filtered
     
-    def _generate_single_outfit(
+    def _accessory_options(
         self,
-        base_product: Product,
-        candidates: Dict[Category, List[Product]],
-        request: RecommendationRequest
-    ) -> Outfit:
-        """Generate a single outfit combination."""
-        # Determine which category the base product is in
-        base_category = base_product.category
-        
-        # Select items for each required category
-        top = base_product if base_category == Category.TOP else self._select_item(
-            candidates[Category.TOP], base_product
-        )
-        
-        bottom = base_product if base_category == Category.BOTTOM else self._select_item(
-            candidates[Category.BOTTOM], base_product
-        )
-        
-        footwear = base_product if base_category == Category.FOOTWEAR else self._select_item(
-            candidates[Category.FOOTWEAR], base_product
-        )
+        accessory_candidates: np.ndarray,
+        candidate_set: CandidateSet
+    ) -> np.ndarray:
+        """
+        Accessory sets an outfit can take: the best 1, 2 or 3 ranked accessory
+        candidates. Returns an (options, 3) array of product indices padded
+        with -1 (a single empty option when there are no accessories).
+        """
+        if not len(accessory_candidates):
+            return np.full((1, 3), -1, dtype=np.int32)
         
-        # Select at least one accessory
-        num_accessories = random.randint(1, 3)  # 1-3 accessories
-        accessories = []
-        for _ in range(num_accessories):
-            if candidates[Category.ACCESSORY]:
-                acc = self._select_item(candidates[Category.ACCESSORY], base_product)
-                if acc and acc not in accessories:
-                    accessories.append(acc)
+        # Ranked once per request; the best picks are distinct by construction
+        ranked = self._rank_candidates(accessory_candidates, candidate_set, Category.ACCESSORY)
+        if not len(ranked):
+            # Only the base product itself is left
+            ranked = accessory_candidates
+        best = ranked[:3]
         
-        if not accessories and candidates[Category.ACCESSORY]:
-            accessories.append(self._select_item(candidates[Category.ACCESSORY], base_product))
+        # Option k holds the best k + 1 accessories
+        return np.where(
+            np.arange(3) <= np.arange(len(best))[:, None],
+            np.pad(best, (0, 3 - len(best)), constant_values=-1),
+            -1
+        ).astype(np.int32)
+    
+    def _build_outfit(self, row: np.ndarray) -> Outfit:
+        """Build an outfit from a row of product indices (-1 = empty slot)."""
+        top_idx, bottom_idx, footwear_idx, *accessory_idxs = row.tolist()
+        top = self.products[top_idx]
+        bottom = self.products[bottom_idx]
+        footwear = self.products[footwear_idx]
+        accessories = [self.products[i] for i in accessory_idxs if i >= 0]
         
         # Calculate total price
         total_price = (
@@ -225,47 +333,15 @@ class OutfitRecommender:
             total_price=total_price
         )
     
-    def _select_item(self, candidates: List[Product], base_product: Product) -> Product:
-        """Select an item that's compatible with the base product."""
-        if not candidates:
-            raise ValueError("No candidates available")
-        
-        # Score candidates by compatibility with base
-        scored = []
-        for candidate in candidates:
-            if candidate.id == base_product.id:
-                continue
-            
-            # Quick compatibility check
-            compatibility = self._get_compatibility(base_product, candidate)
-            
-            # Bonus for style match
-            style_bonus = 0.2 if candidate.style == base_product.style else 0.0
-            
-            score = compatibility + style_bonus
-            scored.append((score, candidate))
-        
-        # Sort by score and pick from top candidates
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top_candidates = scored[:max(3, len(scored) // 3)]
-        
-        # Random selection from top candidates for variety
-        if top_candidates:
-            return random.choice(top_candidates)[1]
-        else:
-            return random.choice(candidates)
-    
-    def _get_compatibility(self, p1: Product, p2: Product) -> float:
-        """Get precomputed compatibility score."""
-        key = tuple(sorted([p1.id, p2.id]))
-        return self.compatibility_cache.get(key, 0.5)
-    
-    def _is_duplicate(self, outfit: Outfit, existing: List[Outfit]) -> bool:
-        """Check if outfit is too similar to existing ones."""
-        for existing_outfit in existing:
-            if (outfit.top.id == existing_outfit.top.id and
-                outfit.bottom.id == existing_outfit.bottom.id and
-                outfit.footwear.id == existing_outfit.footwear.id):
-                return True
-        return False
-
+    def _rank_candidates(
+        self,
+        candidates: np.ndarray,
+        candidate_set: CandidateSet,
+        category: Category
+    ) -> np.ndarray:
+        """
+        Order a category's candidate indices by score against the base, best
+        first, by filtering the presorted order. The base product is excluded.
+        """
+        ranked = candidate_set.ranked[category]
+        return ranked[np.isin(ranked, candidates, assume_unique=True)]
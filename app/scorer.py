@@ -2,8 +2,114 @@
 Scoring system for outfit recommendations.
 Calculates match_score (0-1) based on multiple factors.
 """
-from typing import List, Tuple
-from app.models import Outfit, Product, Color, Occasion, Season, Style
+from typing import Optional, Tuple
+from functools import lru_cache
+from cachetools import cached, LRUCache
+import numpy as np
+from app.models import (
+    Outfit, Product, Occasion, Season, ProductColumns,
+    OCCASION_BITS, SEASON_IDS, ALL_SEASON_ID
+)
+
+
+@cached(cache=LRUCache(maxsize=4096), key=lambda items: tuple(item.id for item in items))
+def _color_harmony(items: Tuple[Product, ...]) -> Tuple[float, str]:
+    """
+    Score color harmony using HSV color theory.
+    Depends only on the items, so results are memoized by item ids.
+    Returns (score, reason)
+    """
+    # Calculate color harmony using complementary, analogous, and triadic schemes
+    harmony_score = 0.0
+    reasons = []
+    
+    # Get base color (top), using the HSV cached on each product
+    base_hue = items[0].hue
+    
+    # Check each item against base
+    for i, item in enumerate(items[1:], 1):
+        hue_diff = abs(item.hue - base_hue)
+        
+        # Normalize hue difference (0-180 degrees)
+        if hue_diff > 180:
+            hue_diff = 360 - hue_diff
+        
+        # Score based on color harmony rules:
+        # - Analogous (0-30°): High score
+        # - Complementary (150-180°): High score
+        # - Triadic (120°): Medium-high score
+        # - Monochromatic (same hue): High score
+        
+        if hue_diff < 15:  # Monochromatic/very similar
+            item_score = 0.95
+            reasons.append(f"{items[i].name} matches base color")
+        elif hue_diff < 30:  # Analogous
+            item_score = 0.85
+            reasons.append(f"{items[i].name} is analogous to base")
+        elif 115 < hue_diff < 125:  # Triadic
+            item_score = 0.75
+            reasons.append(f"{items[i].name} creates triadic harmony")
+        elif 150 < hue_diff < 180:  # Complementary
+            item_score = 0.80
+            reasons.append(f"{items[i].name} complements base color")
+        elif 30 < hue_diff < 60:  # Split complementary
+            item_score = 0.70
+            reasons.append(f"{items[i].name} creates split complementary harmony")
+        else:
+            item_score = 0.50  # Less harmonious
+            reasons.append(f"{items[i].name} has moderate color harmony")
+        
+        harmony_score += item_score
+    
+    # Average harmony score
+    avg_score = harmony_score / len(items[1:]) if len(items) > 1 else 0.5
+    
+    # Bonus for neutral colors (low saturation)
+    neutral_bonus = 0.0
+    neutral_count = sum(1 for item in items if item.sat < 0.2)
+    if neutral_count > 0:
+        neutral_bonus = min(0.1, neutral_count * 0.03)
+        reasons.append(f"{neutral_count} neutral item(s) add versatility")
+    
+    final_score = min(1.0, avg_score + neutral_bonus)
+    reason = "; ".join(reasons[:3])  # Limit to 3 reasons
+    
+    return final_score, reason or "Color harmony evaluated"
+
+
+def _harmony_kernel(hues: np.ndarray, sats: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _color_harmony score for (M, K) arrays of item hues and
+    saturations, top first; `valid` masks out empty slots.
+    Returns the (M,) scores, bit-identical to the scalar version.
+    """
+    num_outfits, num_slots = hues.shape
+    
+    # Bucket each item's hue difference from the top, one column at a time
+    # so the sum accumulates in the same order as the scalar loop
+    harmony_score = np.zeros(num_outfits)
+    for j in range(1, num_slots):
+        hue_diff = np.abs(hues[:, j] - hues[:, 0])
+        hue_diff = np.where(hue_diff > 180, 360 - hue_diff, hue_diff)
+        item_score = np.select(
+            [
+                hue_diff < 15,
+                hue_diff < 30,
+                (hue_diff > 115) & (hue_diff < 125),
+                (hue_diff > 150) & (hue_diff < 180),
+                (hue_diff > 30) & (hue_diff < 60)
+            ],
+            [0.95, 0.85, 0.75, 0.80, 0.70],
+            default=0.50
+        )
+        harmony_score += np.where(valid[:, j], item_score, 0.0)
+    avg_score = harmony_score / (valid.sum(axis=1) - 1)
+    
+    # Bonus for neutral colors (low saturation)
+    neutral_count = (valid & (sats < 0.2)).sum(axis=1)
+    neutral_bonus = np.where(neutral_count > 0, np.minimum(0.1, neutral_count * 0.03), 0.0)
+    
+    return np.minimum(1.0, avg_score + neutral_bonus)
 
 
 class OutfitScorer:
@@ -20,6 +126,8 @@ class OutfitScorer:
         self.target_occasion = target_occasion
         self.target_season = target_season
         self.max_budget = max_budget
+        self._occasion_bit = OCCASION_BITS[target_occasion] if target_occasion else 0
+        self._season_id = SEASON_IDS[target_season] if target_season else -1
     
     def score_outfit(self, outfit: Outfit) -> Tuple[float, str]:
         """
@@ -52,82 +160,92 @@ class OutfitScorer:
         
         return total_score, reasoning
     
-    def _score_color_harmony(self, outfit: Outfit) -> Tuple[float, str]:
+    def score_batch(self, catalog: ProductColumns, outfit_idxs: np.ndarray) -> np.ndarray:
         """
-        Score color harmony using HSV color theory.
-        Returns (score, reason)
+        Vectorized score_outfit for many outfits at once, without reasoning.
+        outfit_idxs is an (M, K) array of product indices into catalog with the
+        top, bottom and footwear in the first three columns; -1 marks an empty slot.
+        Returns the (M,) match scores, identical to what score_outfit gives.
         """
-        items = [outfit.top, outfit.bottom, outfit.footwear] + outfit.accessories
-        colors = [item.color for item in items]
-        
-        # Calculate color harmony using complementary, analogous, and triadic schemes
-        harmony_score = 0.0
-        reasons = []
-        
-        # Get base color (top)
-        base_hsv = colors[0].to_hsv()
-        base_hue = base_hsv[0]
-        
-        # Check each item against base
-        for i, color in enumerate(colors[1:], 1):
-            hsv = color.to_hsv()
-            hue_diff = abs(hsv[0] - base_hue)
-            
-            # Normalize hue difference (0-180 degrees)
-            if hue_diff > 180:
-                hue_diff = 360 - hue_diff
-            
-            # Score based on color harmony rules:
-            # - Analogous (0-30°): High score
-            # - Complementary (150-180°): High score
-            # - Triadic (120°): Medium-high score
-            # - Monochromatic (same hue): High score
-            
-            if hue_diff < 15:  # Monochromatic/very similar
-                item_score = 0.95
-                reasons.append(f"{items[i].name} matches base color")
-            elif hue_diff < 30:  # Analogous
-                item_score = 0.85
-                reasons.append(f"{items[i].name} is analogous to base")
-            elif 115 < hue_diff < 125:  # Triadic
-                item_score = 0.75
-                reasons.append(f"{items[i].name} creates triadic harmony")
-            elif 150 < hue_diff < 180:  # Complementary
-                item_score = 0.80
-                reasons.append(f"{items[i].name} complements base color")
-            elif 30 < hue_diff < 60:  # Split complementary
-                item_score = 0.70
-                reasons.append(f"{items[i].name} creates split complementary harmony")
-            else:
-                item_score = 0.50  # Less harmonious
-                reasons.append(f"{items[i].name} has moderate color harmony")
-            
-            harmony_score += item_score
-        
-        # Average harmony score
-        avg_score = harmony_score / len(colors[1:]) if len(colors) > 1 else 0.5
+        num_outfits, num_slots = outfit_idxs.shape
+        valid = outfit_idxs >= 0
+        idxs = np.where(valid, outfit_idxs, 0)
+        num_items = valid.sum(axis=1)
+        
+        # Color harmony
+        color_score = _harmony_kernel(catalog.hues[idxs], catalog.sats[idxs], valid)
+        
+        # Style compatibility against the top's style
+        styles = catalog.style_ids[idxs]
+        style_matches = (valid[:, 1:] & (styles[:, 1:] == styles[:, :1])).sum(axis=1)
+        match_ratio = style_matches / (num_items - 1)
+        style_score = np.select([match_ratio == 1.0, match_ratio >= 0.5], [1.0, 0.75], default=0.55)
+        
+        if self.target_occasion:
+            occasion_hits = (catalog.occasion_masks[idxs] & self._occasion_bit) != 0
+            occasion_score = self._batch_fit_score((valid & occasion_hits).sum(axis=1) / num_items)
+        else:
+            occasion_score = 0.7
         
-        # Bonus for neutral colors (low saturation)
-        neutral_bonus = 0.0
-        neutral_count = sum(1 for c in colors if c.to_hsv()[1] < 0.2)
-        if neutral_count > 0:
-            neutral_bonus = min(0.1, neutral_count * 0.03)
-            reasons.append(f"{neutral_count} neutral item(s) add versatility")
+        if self.target_season:
+            seasons = catalog.season_ids[idxs]
+            season_hits = (seasons == self._season_id) | (seasons == ALL_SEASON_ID)
+            season_score = self._batch_fit_score((valid & season_hits).sum(axis=1) / num_items)
+        else:
+            season_score = 0.7
         
-        final_score = min(1.0, avg_score + neutral_bonus)
-        reason = "; ".join(reasons[:3])  # Limit to 3 reasons
+        if self.max_budget:
+            # Summed in the same order as Outfit.total_price
+            prices = np.where(valid, catalog.prices[idxs], 0.0)
+            accessory_total = np.zeros(num_outfits)
+            for j in range(3, num_slots):
+                accessory_total += prices[:, j]
+            total_price = prices[:, 0] + prices[:, 1] + prices[:, 2] + accessory_total
+            overage = total_price - self.max_budget
+            budget_score = np.where(
+                total_price <= self.max_budget,
+                np.where(total_price / self.max_budget < 0.7, 0.9, 1.0),
+                np.maximum(0.1, 0.5 - np.minimum(0.5, overage / self.max_budget))
+            )
+        else:
+            budget_score = 0.7
         
-        return final_score, reason or "Color harmony evaluated"
+        # Weighted average
+        return (
+            color_score * self.COLOR_WEIGHT +
+            style_score * self.STYLE_WEIGHT +
+            occasion_score * self.OCCASION_WEIGHT +
+            season_score * self.SEASON_WEIGHT +
+            budget_score * self.BUDGET_WEIGHT
+        )
+    
+    @staticmethod
+    def _batch_fit_score(match_ratio: np.ndarray) -> np.ndarray:
+        """Occasion/season fit score buckets for an array of match ratios."""
+        return np.select(
+            [match_ratio >= 0.8, match_ratio >= 0.6, match_ratio >= 0.4],
+            [1.0, 0.8, 0.6],
+            default=0.4
+        )
+    
+    def _score_color_harmony(self, outfit: Outfit) -> Tuple[float, str]:
+        """
+        Score color harmony using HSV color theory.
+        Returns (score, reason)
+        """
+        items = (outfit.top, outfit.bottom, outfit.footwear, *outfit.accessories)
+        return _color_harmony(items)
     
     def _score_style_compatibility(self, outfit: Outfit) -> Tuple[float, str]:
         """Score how well styles match across items."""
         items = [outfit.top, outfit.bottom, outfit.footwear] + outfit.accessories
-        styles = [item.style for item in items]
+        style_ids = [item.style_id for item in items]
         
         # Count style matches
-        base_style = styles[0]
-        matches = sum(1 for style in styles[1:] if style == base_style)
-        total = len(styles) - 1
+        base_style = items[0].style
+        base_style_id = style_ids[0]
+        matches = sum(1 for style_id in style_ids[1:] if style_id == base_style_id)
+        total = len(style_ids) - 1
         
         if total == 0:
             return 1.0, "Single item"
@@ -153,7 +271,7 @@ class OutfitScorer:
             return 0.7, "No specific occasion specified"
         
         items = [outfit.top, outfit.bottom, outfit.footwear] + outfit.accessories
-        matching_items = sum(1 for item in items if self.target_occasion in item.occasion)
+        matching_items = sum(1 for item in items if item.occasion_bits & self._occasion_bit)
         total = len(items)
         
         match_ratio = matching_items / total
@@ -181,7 +299,7 @@ class OutfitScorer:
         items = [outfit.top, outfit.bottom, outfit.footwear] + outfit.accessories
         matching_items = sum(
             1 for item in items 
-            if item.season == self.target_season or item.season == Season.ALL_SEASON
+            if item.season_id == self._season_id or item.season_id == ALL_SEASON_ID
         )
         total = len(items)
         
@@ -253,3 +371,16 @@ class OutfitScorer:
         
         return ". ".join(parts) if parts else "Well-coordinated outfit"
 
+
+@lru_cache(maxsize=128)
+def get_scorer(
+    target_occasion: Optional[Occasion] = None,
+    target_season: Optional[Season] = None,
+    max_budget: Optional[float] = None
+) -> OutfitScorer:
+    """Get a shared scorer for the given targets (scorers hold no per-outfit state)."""
+    return OutfitScorer(
+        target_occasion=target_occasion,
+        target_season=target_season,
+        max_budget=max_budget
+    )
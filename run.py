@@ -1,6 +1,8 @@
 """
 Simple script to run the Outfit Recommendation API server.
+Set DEV=1 to run a single auto-reloading worker for development.
 """
+import os
 import uvicorn
 
 if __name__ == "__main__":
@@ -9,10 +11,22 @@ if __name__ == "__main__":
     print("Documentation: http://localhost:8000/docs")
     print("\nPress Ctrl+C to stop the server\n")
     
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
-
+    if os.getenv("DEV"):
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True
+        )
+    else:
+        # One worker per core; "auto" picks uvloop and httptools
+        # (installed with uvicorn[standard]) where the platform supports them
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=os.cpu_count() or 1,
+            loop="auto",
+            http="auto",
+            access_log=False
+        )